@@ -39,11 +39,12 @@ def read_text_from_file(filename,enc='utf8'):
         text = open(filename,encoding=enc).read()
         return text
     except	UnicodeDecodeError:
-        list = sorted(aliases.keys())
+        # Major encodings first, then every other known alias, so no name is
+        # listed twice; the combobox index refers to this list
+        list = [ item for item in macros.major_character_encodings_list
+            if item in aliases ] + sorted(item for item in aliases
+            if item not in macros.MAJOR_CHARACTER_ENCODINGS)
         combobox = widget.ComboBox()
-        for item in macros.major_character_encodings_list:
-            if(item in list):
-                combobox.add_item(item)
         for item in list:
             combobox.add_item(item)
         combobox.set_active(0)
@@ -183,7 +184,7 @@ class BasicTextView(text_view.TextView):
             response = save_file.run()
             if response == file_chooser.FileChooserDialog.ACCEPT:
                 self.save_file_name = save_file.get_filename()
-                if(self.save_file_name.split(".")[-1] not in macros.supported_text_formats):
+                if(os.path.splitext(self.save_file_name)[1][1:].lower() not in macros.SUPPORTED_TEXT_EXTS):
                     self.save_file_name = self.save_file_name + ".text"
                 open(self.save_file_name,'w').write(text)
                 self.save_bookmark_table()
@@ -18,35 +18,39 @@
 ###########################################################################
 
 import os
-import itertools
+import sys
 
 datadir = ''
 
-def get_list_of_mixed_case_combinations(list_items):
-    return list(itertools.chain.from_iterable(
-        [[''.join(a) for a in itertools.product(*zip(s.upper(), s.lower()))] 
-         for s in list_items]
-    ))
+# HOME may be unset in minimal environments (containers, services)
+user_home_path = os.environ.get('HOME') or os.path.expanduser('~')
 
-user_home_path = os.environ['HOME']
-
-current_dir = os.path.dirname(os.path.abspath(__file__))
+# __file__ is absolute when imported through a normal sys.path entry, so
+# abspath (and the getcwd behind it) is only needed for a relative one
+current_dir = os.path.dirname(__file__)
+if not os.path.isabs(current_dir):
+    current_dir = os.path.abspath(current_dir)
 parent_dir = os.path.dirname(current_dir)
 
-config_dir = user_home_path + "/.lios"
+# --- Derived paths, built once at import ---
+config_dir = f"{user_home_path}/.lios"
 tmp_dir = "/tmp/Lios/"
-bookmarks_dir = config_dir + "/bookmarks/"
+bookmarks_dir = f"{config_dir}/bookmarks/"
 
-local_text_cleaner_list_file_path = config_dir + "/text_cleaner_list.text"
-preferences_file_path = config_dir + "/preferences.cfg"
-recent_file_path = config_dir + "/recent.text"
-recent_cursor_position_file_path = config_dir + "/recent_cursor_position.text"
+local_text_cleaner_list_file_path = f"{config_dir}/text_cleaner_list.text"
+preferences_file_path = f"{config_dir}/preferences.cfg"
+recent_file_path = f"{config_dir}/recent.text"
+recent_cursor_position_file_path = f"{config_dir}/recent_cursor_position.text"
 
-supported_image_formats = get_list_of_mixed_case_combinations(
-    ["png","pnm","jpg","jpeg","tif","tiff","bmp","pbm","ppm"]
-)
-supported_text_formats = get_list_of_mixed_case_combinations(["txt","text"])
-supported_pdf_formats = get_list_of_mixed_case_combinations(["pdf"])
+# Extensions are lower-case; match a file name with
+# os.path.splitext(name)[1][1:].lower() in SUPPORTED_IMAGE_EXTS
+supported_image_formats = ("png","pnm","jpg","jpeg","tif","tiff","bmp","pbm","ppm")
+supported_text_formats = ("txt","text")
+supported_pdf_formats = ("pdf",)
+
+SUPPORTED_IMAGE_EXTS = frozenset(supported_image_formats)
+SUPPORTED_TEXT_EXTS = frozenset(supported_text_formats)
+SUPPORTED_PDF_EXTS = frozenset(supported_pdf_formats)
 
 version = "2.8"
 
@@ -57,25 +61,53 @@ readme_file = "readme.text"
 default_text_cleaner_list_file_path = "text_cleaner_list.text"
 
 # --- Resolve resource paths ---
-if os.path.exists(os.path.join(datadir, logo_file)):
-    # case: datadir explicitly set before import
-    logo_file = os.path.join(datadir, logo_file)
-    icon_dir = os.path.join(datadir, icon_dir)
-    readme_file = os.path.join(datadir, readme_file)
-
-elif os.path.exists(os.path.join(parent_dir, "share", "lios", logo_file)):
-    # case: running from source tree
-    datadir = os.path.join(parent_dir, "share", "lios")
-    logo_file = os.path.join(datadir, "lios.png")
-    icon_dir = os.path.join(datadir, "icons/")
-    readme_file = os.path.join(datadir, "readme.text")
+_DATADIR_CANDIDATES = (
+    f"{parent_dir}/share/lios",                # source tree
+    f"{user_home_path}/.local/share/lios",     # user install
+    "/usr/share/lios",                         # system-wide
+    "/usr/local/share/lios",
+)
+
+def _apply_datadir(new_datadir):
+    """Point the resource paths at new_datadir without checking it."""
+    global datadir, logo_file, icon_dir, readme_file
+    global default_text_cleaner_list_file_path
 
-else:
-    # case: installed system-wide
-    datadir = "/usr/share/lios"
+    datadir = new_datadir
     logo_file = os.path.join(datadir, "lios.png")
     icon_dir = os.path.join(datadir, "icons/")
     readme_file = os.path.join(datadir, "readme.text")
+    default_text_cleaner_list_file_path = os.path.join(datadir, "text_cleaner_list.text")
+    # Inherited by child processes so their import skips resolution
+    os.environ["LIOS_DATADIR"] = datadir
+
+def _has_resources(candidate):
+    """True if candidate holds the logo file and the icons directory."""
+    # One scandir answers both from the cached entry types, where separate
+    # probes would stat each name
+    try:
+        with os.scandir(candidate) as entries:
+            found = {entry.name for entry in entries
+                     if (entry.name == "lios.png" and entry.is_file())
+                     or (entry.name == "icons" and entry.is_dir())}
+    except OSError:
+        return False
+    return len(found) == 2
+
+def _resolve_datadir():
+    """Point the resource paths at the first candidate holding the resources.
+    LIOS_DATADIR, set by a parent Lios process or the user, takes priority."""
+    inherited = os.environ.get("LIOS_DATADIR")
+    if inherited and _has_resources(inherited):
+        _apply_datadir(inherited)
+        return
+    for candidate in _DATADIR_CANDIDATES:
+        if _has_resources(candidate):
+            _apply_datadir(candidate)
+            return
+    _apply_datadir("/usr/share/lios")
+
+_resolve_datadir()
 
 
 app_name = "Linux-intelligent-ocr-solution"
@@ -85,27 +117,23 @@ source_link = "https://gitlab.com/Nalin-x-Linux/lios-3"
 home_page_link = "https://www.zendalona.com/lios"
 video_tutorials_link = "https://www.youtube.com/playlist?list=PLn29o8rxtRe1zS1r2-yGm1DNMOZCgdU0i"
 
-major_character_encodings_list = [
+# Offered first, in this order, when a text file fails to decode. Interned
+# because names like 'utf-8' are not auto-interned, and equal interned
+# strings compare by identity.
+major_character_encodings_list = tuple(sys.intern(name) for name in (
  'us_ascii', 'utf-8', 'iso_8859_1','latin1',
  'iso_8859_2', 'iso_8859_7', 'iso_8859_9', 'iso_8859_15', 'eucjp', 'euckr',
  'gb2312_80', 'gb2312_1980', 'windows_1251', 'windows_1252', 'windows_1253',
  'windows_1254', 'windows_1255', 'windows_1256', 'windows_1257', 'windows_1258',
- 'shiftjis', 'windows_1256', 'big5_hkscs', 'big5_tw', 'tis620'
-]
+ 'shiftjis', 'big5_hkscs', 'big5_tw', 'tis620'
+))
+MAJOR_CHARACTER_ENCODINGS = frozenset(major_character_encodings_list)
 
 # --- Safe setter ---
 def set_datadir(new_datadir):
-    """Override datadir at runtime (avoids double-prefixing)."""
-    global datadir, logo_file, icon_dir, readme_file
-    global default_text_cleaner_list_file_path
-
-    datadir = new_datadir
-
-    if not logo_file.startswith(datadir):
-        logo_file = os.path.join(datadir, "lios.png")
-    if not icon_dir.startswith(datadir):
-        icon_dir = os.path.join(datadir, "icons/")
-    if not readme_file.startswith(datadir):
-        readme_file = os.path.join(datadir, "readme.text")
-    if not default_text_cleaner_list_file_path.startswith(datadir):
-        default_text_cleaner_list_file_path = os.path.join(datadir, "text_cleaner_list.text")
+    """Override datadir at runtime. Directories without the resources are
+    ignored so the resolved datadir stays in use; returns True if applied."""
+    if _has_resources(new_datadir):
+        _apply_datadir(new_datadir)
+        return True
+    return False
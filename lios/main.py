@@ -554,7 +554,7 @@ class linux_intelligent_ocr_solution():
 						
 		for image in file_list:
 			if(len(image.split("."))>1):
-				if (image.split(".")[1] in macros.supported_image_formats):
+				if (os.path.splitext(image)[1][1:].lower() in macros.SUPPORTED_IMAGE_EXTS):
 					filename = "{}{}".format(macros.tmp_dir,image)
 					filename = self.get_feesible_filename_from_filename(filename)
 					loop.acquire_lock()
@@ -1491,20 +1491,21 @@ pacman -S aspell-{1}""").format(lang, langdict, langdict, langdict, langdict))
 	def open_list_of_files(self,file_list):
 		recently_added_list = []
 		for item in file_list:
-			if item.split('.')[-1] in macros.supported_image_formats:
+			extension = os.path.splitext(item)[1][1:].lower()
+			if extension in macros.SUPPORTED_IMAGE_EXTS:
 				filename = item.split("/")[-1:][0]
 				destination = "{0}{1}".format(macros.tmp_dir,filename.replace(' ','-'))
 				destination = self.get_feesible_filename_from_filename(destination)
 				self.add_image_to_list(item,destination,False)
 				recently_added_list.append(destination)
 
-			if item.split('.')[-1] in ["pdf","Pdf"]:
+			if extension in macros.SUPPORTED_PDF_EXTS:
 				self.import_images_from_pdf(item)
 				# import_images_from_pdf is a threaded function
 				# so stopping with one file
 				return;
 
-			if item.split('.')[-1] in macros.supported_text_formats:
+			if extension in macros.SUPPORTED_TEXT_EXTS:
 				text = editor.read_text_from_file(item)
 				if(len(file_list) == 1):
 					self.textview.set_text(text)
@@ -28,6 +28,17 @@ from functools import wraps
 from typing import Callable, Any
 
 
+# Version facts never change within a process, so compute them once
+_PY_VER = tuple(sys.version_info[:3])
+_NEEDS_FORK_WORKAROUND = sys.version_info >= (3, 14)
+
+# Mirrors MultiprocessingCompatibility._initialized for the decorator fast path
+_INITIALIZED = False
+
+# Start method as last read or set by initialize(); None until then
+_START_METHOD = None
+
+
 class MultiprocessingCompatibility:
     """
     Handles multiprocessing compatibility across Python versions.
@@ -37,14 +48,11 @@ class MultiprocessingCompatibility:
     """
     
     _initialized = False
-    _python_version = sys.version_info
     
     @classmethod
     def get_python_version_info(cls) -> tuple:
         """Returns (major, minor, micro) Python version tuple."""
-        return (cls._python_version.major, 
-                cls._python_version.minor, 
-                cls._python_version.micro)
+        return _PY_VER
     
     @classmethod
     def needs_fork_workaround(cls) -> bool:
@@ -54,8 +62,7 @@ class MultiprocessingCompatibility:
         Returns:
             bool: True if Python >= 3.14, False otherwise
         """
-        major, minor, _ = cls.get_python_version_info()
-        return major == 3 and minor >= 14 or major > 3
+        return _NEEDS_FORK_WORKAROUND
     
     @classmethod
     def initialize(cls, force: bool = False, verbose: bool = False) -> bool:
@@ -69,36 +76,40 @@ class MultiprocessingCompatibility:
         Returns:
             bool: True if initialization was successful or already done
         """
-        if cls._initialized and not force:
+        global _INITIALIZED, _START_METHOD
+
+        if _INITIALIZED and not force:
             if verbose:
                 print("[mp_compat] Already initialized")
             return True
         
-        major, minor, micro = cls.get_python_version_info()
-        
         if verbose:
+            major, minor, micro = _PY_VER
             print(f"[mp_compat] Python {major}.{minor}.{micro} detected")
         
-        if cls.needs_fork_workaround():
+        if _NEEDS_FORK_WORKAROUND:
             try:
-                current_method = multiprocessing.get_start_method(allow_none=True)
+                if _START_METHOD is None or force:
+                    _START_METHOD = multiprocessing.get_start_method(allow_none=True)
+                current_method = _START_METHOD
                 
                 if current_method != 'fork':
                     multiprocessing.set_start_method('fork', force=force)
+                    _START_METHOD = 'fork'
                     if verbose:
                         print(f"[mp_compat] Changed start method from '{current_method}' to 'fork'")
                 else:
                     if verbose:
                         print("[mp_compat] Start method already set to 'fork'")
                 
-                cls._initialized = True
+                cls._initialized = _INITIALIZED = True
                 return True
                 
             except RuntimeError as e:
                 if "context has already been set" in str(e) and not force:
                     if verbose:
                         print("[mp_compat] Start method already set (cannot change)")
-                    cls._initialized = True
+                    cls._initialized = _INITIALIZED = True
                     return True
                 elif verbose:
                     print(f"[mp_compat] Warning: Could not set start method: {e}")
@@ -106,7 +117,7 @@ class MultiprocessingCompatibility:
         else:
             if verbose:
                 print("[mp_compat] No workaround needed for this Python version")
-            cls._initialized = True
+            cls._initialized = _INITIALIZED = True
             return True
     
     @classmethod
@@ -117,16 +128,18 @@ class MultiprocessingCompatibility:
         Returns:
             dict: Status information including version, method, and compatibility
         """
-        major, minor, micro = cls.get_python_version_info()
-        current_method = multiprocessing.get_start_method(allow_none=True)
+        major, minor, micro = _PY_VER
+        current_method = _START_METHOD
+        if current_method is None:
+            current_method = multiprocessing.get_start_method(allow_none=True)
         
         return {
             'python_version': f"{major}.{minor}.{micro}",
             'python_version_tuple': (major, minor, micro),
-            'needs_workaround': cls.needs_fork_workaround(),
+            'needs_workaround': _NEEDS_FORK_WORKAROUND,
             'current_start_method': current_method,
             'initialized': cls._initialized,
-            'compatible': current_method == 'fork' if cls.needs_fork_workaround() else True
+            'compatible': current_method == 'fork' if _NEEDS_FORK_WORKAROUND else True
         }
 
 
@@ -149,7 +162,8 @@ def ensure_fork_context(func: Callable) -> Callable:
     """
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        MultiprocessingCompatibility.initialize()
+        if not _INITIALIZED:
+            MultiprocessingCompatibility.initialize()
         return func(*args, **kwargs)
     return wrapper
 
@@ -23,8 +23,10 @@ from lios.ocr.ocr_engine_base import OcrEngineBase
 
 class OcrEngineAbbyyFineReader9(OcrEngineBase):
 	name = "ABBYY FineReader9"
+	__slots__ = ()
 	
 	def __init__(self,language=None):
+		super().__init__()
 		self.set_language(language)
 
 	def is_available():
@@ -17,13 +17,47 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###########################################################################
 
+import os
 import abc
-import multiprocessing
+import atexit
+
+# multiprocessing (and mp_compat, which imports it) is imported inside the
+# methods that need it, so availability probes don't pay for it at startup
+
+
+# Engines rebuilt inside a batch OCR worker process, keyed by class and
+# configuration so a reused pool follows language changes. The worker lives
+# at module level so it stays picklable under the 'forkserver' start method
+# (Python 3.14+), unlike a lambda.
+_worker_engines = {}
+
+def _ocr_worker(engine_class, config, image_file_name):
+	key = (engine_class, tuple(sorted(config.items())))
+	engine = _worker_engines.get(key)
+	if engine is None:
+		engine = _worker_engines[key] = engine_class()
+		for attribute, value in config.items():
+			setattr(engine, attribute, value)
+	return engine.ocr_image_to_text(image_file_name)
+
+# Batch OCR pools shared by every engine instance, one per start method.
+# Tasks carry the engine class and configuration, so a single pool serves
+# all engines and jobs for the life of the process.
+_pools = {}
 
 
 class OcrEngineBase(metaclass=abc.ABCMeta):
+	# Attribute holding the language of each slot, first slot at index 0
+	_LANG_ATTRS = ("language","language_2","language_3")
+
+	# Engines are built per OCR job and per worker; subclasses declare an
+	# empty __slots__ so instances stay dict-free
+	__slots__ = ("language","language_2","language_3")
+
 	def __init__(self,language=None):
 		self.language = language
+		self.language_2 = False
+		self.language_3 = False
 	
 	@staticmethod
 	@abc.abstractmethod
@@ -39,34 +73,44 @@ class OcrEngineBase(metaclass=abc.ABCMeta):
 	def ocr_image_to_text(self,image_file_name):
 		pass
 	
+	@staticmethod
 	def cancel():
 		pass
-		
 
-	def set_language(self,language):
-		if language in self.__class__.get_available_languages():
-			self.language = language
+	@classmethod
+	def _cached_languages(cls):
+		# Looked up in the class's own __dict__ so each engine keeps its own
+		# set; listing languages can mean scanning data directories.
+		languages = cls.__dict__.get("_languages_cache")
+		if languages is None:
+			languages = frozenset(cls.get_available_languages())
+			cls._languages_cache = languages
+		return languages
+
+	@classmethod
+	def invalidate_languages(cls):
+		"""Forget the cached language set, e.g. after tessdata was added."""
+		if "_languages_cache" in cls.__dict__:
+			del cls._languages_cache
+
+	def set_language(self,language,slot=1):
+		# A rejected language clears the slot, whichever slot it is
+		attribute = self._LANG_ATTRS[slot-1]
+		if language in self._cached_languages():
+			setattr(self,attribute,language)
 			return True
 		else:
+			setattr(self,attribute,False)
 			return False
 
 	def set_language_2(self,language):
-		if language in self.__class__.get_available_languages():
-			self.language_2 = language
-			return True
-		else:
-			self.language_2 = False
-			return False
+		return self.set_language(language,2)
 
 	def set_language_3(self,language):
-		if language in self.__class__.get_available_languages():
-			self.language_3 = language
-			return True
-		else:
-			self.language_3 = False
-			return False
+		return self.set_language(language,3)
 	
 	def ocr_image_to_text_with_multiprocessing(self,image_file_name):
+		import multiprocessing
 		parent_conn, child_conn = multiprocessing.Pipe()
 		
 		p = multiprocessing.Process(target=(lambda parent_conn, child_conn,
@@ -78,6 +122,43 @@ class OcrEngineBase(metaclass=abc.ABCMeta):
 		
 		return parent_conn.recv();
 
+	def get_worker_config(self):
+		"""Picklable state needed to rebuild this engine in a worker process."""
+		return { "language" : self.language,
+			"language_2" : self.language_2,
+			"language_3" : self.language_3 }
+
+	@staticmethod
+	def get_pool():
+		"""Shared worker pool, created on first use and reused by later batches."""
+		import multiprocessing
+		from lios.mp_compat import MultiprocessingCompatibility
+		if MultiprocessingCompatibility.needs_fork_workaround():
+			context = multiprocessing.get_context('fork')
+		else:
+			context = multiprocessing.get_context()
+		start_method = context.get_start_method()
+		pool = _pools.get(start_method)
+		if pool is None:
+			pool = _pools[start_method] = context.Pool(os.cpu_count())
+			atexit.register(pool.close)
+		return pool
+
+	@staticmethod
+	def terminate_pool():
+		"""Stop the shared worker pools; the next batch starts new ones."""
+		while _pools:
+			start_method, pool = _pools.popitem()
+			atexit.unregister(pool.close)
+			pool.terminate()
+
+	def ocr_images_to_text(self,image_file_names):
+		"""Recognize several images in parallel, returning texts in order.
+		Engines may override this with their own batch mode."""
+		config = self.get_worker_config()
+		return self.get_pool().starmap(_ocr_worker,
+			[ (self.__class__, config, name) for name in image_file_names ])
+
 
 	@staticmethod
 	@abc.abstractmethod
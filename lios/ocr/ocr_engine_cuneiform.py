@@ -29,8 +29,10 @@ LANGUAGES_SPLIT_RE = re.compile("[^a-z]")
 
 class OcrEngineCuneiform(OcrEngineBase):
 	name = "Cuneiform"
+	__slots__ = ()
 	
 	def __init__(self,language=None):
+		super().__init__()
 		self.set_language(language)
 
 	def is_available():
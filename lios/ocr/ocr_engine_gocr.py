@@ -24,8 +24,10 @@ from lios.ocr.ocr_engine_base import OcrEngineBase
 
 class OcrEngineGocr(OcrEngineBase):
 	name = "Gocr"
+	__slots__ = ()
 	
 	def __init__(self,language=None):
+		super().__init__()
 		self.set_language(language)
 
 	def is_available():
@@ -47,8 +47,10 @@ TESSDATA_EXTENSION = ".traineddata"
 
 class OcrEngineTesseract(OcrEngineBase):
 	name = "Tesseract"
+	__slots__ = ()
 	
 	def __init__(self,language=None):
+		super().__init__()
 		self.set_language(language)
 
 	def is_available():
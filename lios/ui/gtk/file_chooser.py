@@ -45,7 +45,10 @@ class FileChooserDialog(Gtk.FileChooserDialog):
 		if action != Gtk.FileChooserAction.SELECT_FOLDER and filters:
 			file_filter = Gtk.FileFilter()
 			for item in filters:
-				file_filter.add_pattern("*." + item)
+				# Gtk patterns are case sensitive, so match each letter in both cases
+				file_filter.add_pattern("*." + "".join(
+					"[{}{}]".format(c.lower(), c.upper()) if c.isalpha() else c
+					for c in item))
 			self.add_filter(file_filter)
 
 		if dir: